@@ -7,7 +7,7 @@ import httpx
 import ulid
 
 from ..config import settings
-from ..db import execute_query
+from ..db import execute_query, execute_read, forget_reads
 from ..models import (
     Application, ApplicationCreate, ApplicationUpdate,
     Configuration, ConfigurationCreate, ConfigurationUpdate,
@@ -103,6 +103,7 @@ async def auth_callback(code: str = Query(...)):
     RETURNING *
     """
     await execute_query(upsert_query, (username, github_id, avatar_url, email))
+    forget_reads()
 
     # Create JWT
     jwt_token = create_jwt(github_id, username)
@@ -132,18 +133,19 @@ async def create_application(app: ApplicationCreate, current_user: User = Depend
     app_id = ulid.ULID()
     query = "INSERT INTO applications (id, name, comments) VALUES (%s, %s, %s) RETURNING id"
     await execute_query(query, (str(app_id), app.name, app.comments))
+    forget_reads()
     return Application(id=str(app_id), **app.model_dump())
 
 @router.get("/applications/{id}", response_model=Application)
 async def get_application(id: str, current_user: User = Depends(get_current_user)):
     query = "SELECT * FROM applications WHERE id = %s"
-    rows = await execute_query(query, (id,))
+    rows = await execute_read(query, (id,))
     if not rows:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Get related configuration IDs
     config_query = "SELECT id FROM configurations WHERE application_id = %s"
-    configs = await execute_query(config_query, (id,))
+    configs = await execute_read(config_query, (id,))
     config_ids = [row["id"] for row in configs]
     
     return Application(**rows[0], configuration_ids=config_ids)
@@ -151,7 +153,7 @@ async def get_application(id: str, current_user: User = Depends(get_current_user
 @router.get("/applications", response_model=List[Application])
 async def list_applications(current_user: User = Depends(get_current_user)):
     query = "SELECT * FROM applications"
-    rows = await execute_query(query)
+    rows = await execute_read(query)
     # Note: In a real app we'd likely want to join or batch fetch config IDs
     results = []
     for row in rows:
@@ -162,6 +164,7 @@ async def list_applications(current_user: User = Depends(get_current_user)):
 async def update_application(id: str, app: ApplicationUpdate, current_user: User = Depends(get_current_user)):
     query = "UPDATE applications SET name = COALESCE(%s, name), comments = COALESCE(%s, comments) WHERE id = %s RETURNING *"
     rows = await execute_query(query, (app.name, app.comments, id))
+    forget_reads()
     if not rows:
         raise HTTPException(status_code=404, detail="Application not found")
     return Application(**rows[0], configuration_ids=[])
@@ -175,6 +178,7 @@ async def delete_application(id: str, current_user: User = Depends(get_current_u
     DELETE FROM applications WHERE id = %s RETURNING id
     """
     rows = await execute_query(query, (id, id))
+    forget_reads()
     if not rows:
         raise HTTPException(status_code=404, detail="Application not found")
     return
@@ -195,12 +199,13 @@ async def create_configuration(config: ConfigurationCreate, current_user: User =
     except Exception as e:
         # Check for unique constraint or foreign key errors
         raise HTTPException(status_code=400, detail=str(e))
+    forget_reads()
     return Configuration(id=str(config_id), **config.model_dump())
 
 @router.get("/configurations/{id}", response_model=Configuration)
 async def get_configuration(id: str, current_user: User = Depends(get_current_user)):
     query = "SELECT * FROM configurations WHERE id = %s"
-    rows = await execute_query(query, (id,))
+    rows = await execute_read(query, (id,))
     if not rows:
         raise HTTPException(status_code=404, detail="Configuration not found")
     return Configuration(**rows[0])
@@ -218,6 +223,7 @@ async def update_configuration(id: str, config: ConfigurationUpdate, current_use
     """
     config_json = dumps(config.config) if config.config is not None else None
     rows = await execute_query(query, (config.name, config.comments, config_json, id))
+    forget_reads()
     if not rows:
         raise HTTPException(status_code=404, detail="Configuration not found")
     return Configuration(**rows[0])
@@ -226,6 +232,7 @@ async def update_configuration(id: str, config: ConfigurationUpdate, current_use
 async def delete_configuration(id: str, current_user: User = Depends(get_current_user)):
     query = "DELETE FROM configurations WHERE id = %s RETURNING id"
     rows = await execute_query(query, (id,))
+    forget_reads()
     if not rows:
         raise HTTPException(status_code=404, detail="Configuration not found")
     return
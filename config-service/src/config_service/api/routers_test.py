@@ -26,7 +26,7 @@ async def test_create_application(mock_execute):
     assert mock_execute.called
 
 @pytest.mark.asyncio
-@patch("config_service.api.routers.execute_query", new_callable=AsyncMock)
+@patch("config_service.api.routers.execute_read", new_callable=AsyncMock)
 async def test_get_application_not_found(mock_execute):
     mock_execute.return_value = []
     app_id = str(ulid.ULID())
@@ -6,7 +6,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from .config import settings
-from .db import execute_query
+from .db import execute_read
 from .models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
@@ -60,7 +60,7 @@ async def get_current_user(
         )
 
     query = "SELECT * FROM users WHERE github_id = %s"
-    rows = await execute_query(query, (int(github_id),))
+    rows = await execute_read(query, (int(github_id),))
 
     if not rows:
         raise HTTPException(
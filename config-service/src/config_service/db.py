@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
@@ -19,6 +20,10 @@ _pool: ThreadedConnectionPool | None = None
 # Thread pool for running synchronous psycopg2 calls
 _executor = ThreadPoolExecutor(max_workers=10)
 
+# In-flight read queries keyed by (query, params), used by execute_read to
+# coalesce concurrent identical reads into a single database call.
+_inflight: dict[tuple, asyncio.Future] = {}
+
 def init_db():
     global _pool
     if _pool is None:
@@ -66,7 +71,6 @@ async def get_db_cursor() -> AsyncGenerator[RealDictCursor, None]:
 
 async def execute_query(query: str, params: tuple | None = None):
     """Executes a query in the thread pool."""
-    import asyncio
     loop = asyncio.get_running_loop()
     
     def _execute():
@@ -89,3 +93,45 @@ async def execute_query(query: str, params: tuple | None = None):
             _pool.putconn(conn)
             
     return await loop.run_in_executor(_executor, _execute)
+
+
+async def execute_read(query: str, params: tuple | None = None):
+    """
+    Executes a read-only query, coalescing concurrent identical calls.
+
+    If the same query with the same params is already in flight, the caller
+    waits on that call and shares its result (or exception) instead of
+    issuing another query. Only use this for SELECTs; the shared rows must
+    be treated as read-only.
+    """
+    key = (query, params)
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(execute_query(query, params))
+        _inflight[key] = future
+
+        def _done(f: asyncio.Future):
+            # Remove the entry once the query finishes, not when the first
+            # caller returns, so a cancelled caller doesn't detach the
+            # remaining waiters. forget_reads may already have replaced it.
+            if _inflight.get(key) is f:
+                del _inflight[key]
+            # Retrieve the exception so asyncio doesn't log it as unhandled
+            # when every waiter was cancelled before the query failed.
+            if not f.cancelled():
+                f.exception()
+
+        future.add_done_callback(_done)
+    # Shield so that one cancelled request doesn't cancel the shared query.
+    return await asyncio.shield(future)
+
+
+def forget_reads():
+    """
+    Drops all in-flight reads so later execute_read calls start a new query.
+
+    Call after a write has committed: a read issued after the write must not
+    join a query that started before it and return the old rows. Callers
+    already waiting keep their shared result.
+    """
+    _inflight.clear()
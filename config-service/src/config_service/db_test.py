@@ -1,6 +1,8 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
-from config_service.db import init_db, execute_query
+from unittest.mock import AsyncMock, MagicMock, patch
+from config_service import db
+from config_service.db import init_db, execute_query, execute_read, forget_reads
 
 @pytest.mark.asyncio
 @patch("config_service.db.ThreadedConnectionPool")
@@ -15,3 +17,99 @@ async def test_init_db(mock_pool_class):
 async def test_execute_query_no_pool(mock_pool):
     # This should trigger init_db if pool is None, but here we mock the global
     pass
+
+@pytest.mark.asyncio
+@patch("config_service.db.execute_query", new_callable=AsyncMock)
+async def test_execute_read_coalesces_concurrent_calls(mock_execute):
+    async def side_effect(query, params=None):
+        await asyncio.sleep(0.01)
+        return [{"id": params[0]}]
+    mock_execute.side_effect = side_effect
+
+    results = await asyncio.gather(
+        *(execute_read("SELECT * FROM configurations WHERE id = %s", ("a",)) for _ in range(50))
+    )
+
+    assert mock_execute.call_count == 1
+    assert all(r == [{"id": "a"}] for r in results)
+
+    # Once the burst is over, the next read hits the database again
+    await execute_read("SELECT * FROM configurations WHERE id = %s", ("a",))
+    assert mock_execute.call_count == 2
+
+@pytest.mark.asyncio
+@patch("config_service.db.execute_query", new_callable=AsyncMock)
+async def test_execute_read_distinct_keys_not_coalesced(mock_execute):
+    mock_execute.return_value = []
+
+    await asyncio.gather(
+        execute_read("SELECT * FROM configurations WHERE id = %s", ("a",)),
+        execute_read("SELECT * FROM configurations WHERE id = %s", ("b",)),
+    )
+
+    assert mock_execute.call_count == 2
+
+@pytest.mark.asyncio
+@patch("config_service.db.execute_query", new_callable=AsyncMock)
+async def test_execute_read_shares_errors(mock_execute):
+    async def side_effect(query, params=None):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+    mock_execute.side_effect = side_effect
+
+    results = await asyncio.gather(
+        *(execute_read("SELECT * FROM users WHERE github_id = %s", (1,)) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert mock_execute.call_count == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+@pytest.mark.asyncio
+@patch("config_service.db.execute_query", new_callable=AsyncMock)
+async def test_execute_read_after_write_starts_new_query(mock_execute):
+    release_first = asyncio.Event()
+    versions = iter(["old", "new"])
+
+    async def side_effect(query, params=None):
+        version = next(versions)
+        if version == "old":
+            await release_first.wait()
+        return [{"version": version}]
+    mock_execute.side_effect = side_effect
+
+    query = "SELECT * FROM configurations WHERE id = %s"
+    stale = asyncio.create_task(execute_read(query, ("a",)))
+    await asyncio.sleep(0)
+
+    # A write commits while the first read is still pending
+    forget_reads()
+
+    fresh = await execute_read(query, ("a",))
+    assert fresh == [{"version": "new"}]
+    assert mock_execute.call_count == 2
+
+    release_first.set()
+    assert await stale == [{"version": "old"}]
+    assert db._inflight == {}
+
+@pytest.mark.asyncio
+@patch("config_service.db.execute_query", new_callable=AsyncMock)
+async def test_execute_read_cancelled_waiter_does_not_cancel_shared_query(mock_execute):
+    async def side_effect(query, params=None):
+        await asyncio.sleep(0.01)
+        return [{"id": params[0]}]
+    mock_execute.side_effect = side_effect
+
+    query = "SELECT * FROM configurations WHERE id = %s"
+    cancelled = asyncio.create_task(execute_read(query, ("a",)))
+    waiter = asyncio.create_task(execute_read(query, ("a",)))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    assert await waiter == [{"id": "a"}]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert mock_execute.call_count == 1
+    assert db._inflight == {}